@@ -0,0 +1,114 @@
+-- ===================================================================
+-- Declarative Index and Statistics Management
+-- ===================================================================
+
+-- Indexes are declared per model under config.meta.indexes in schema.yml:
+--
+--   config:
+--     meta:
+--       indexes:
+--         - columns: [transaction_key]
+--           unique: true
+--         - columns: [alert_date]
+--           type: brin
+--         - columns: [customer_id]
+--           where: "is_current = TRUE"
+--
+-- apply_indexes runs as a project-wide post-hook. Index names carry a hash of
+-- their definition, so reruns and incremental loads leave matching indexes in
+-- place, changed declarations are rebuilt and removed ones are dropped.
+-- After each load the indexed columns are analyzed; meta.analyze adds more
+-- columns (a list) or analyzes the whole table (true).
+
+{% macro managed_index_name(relation, index) %}
+    {%- set definition = [index.get('unique', false), index.get('type', 'btree'),
+                          index['columns'] | join(','), index.get('where', '')] | join('|') -%}
+    {{- (relation.identifier ~ '_' ~ index['columns'] | join('_'))[:50] ~ '_' ~ local_md5(definition)[:8] -}}
+{% endmacro %}
+
+{% macro apply_indexes() %}
+    {%- set meta = config.get('meta', {}) or {} -%}
+    {%- set declared = meta.get('indexes', []) -%}
+    {%- if execute and config.get('materialized') != 'view' and (declared or meta.get('analyze')) -%}
+
+        {%- set existing_query -%}
+            SELECT c.relname
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE i.indrelid = '{{ this }}'::regclass
+              AND obj_description(c.oid, 'pg_class') = 'managed by apply_indexes'
+        {%- endset -%}
+        {%- set existing = run_query(existing_query).columns[0].values() -%}
+
+        {%- set wanted = [] -%}
+        {%- for index in declared -%}
+            {%- set name = managed_index_name(this, index) -%}
+            {%- do wanted.append(name) -%}
+            {%- if name not in existing %}
+        -- A previous build of a rebuilt table may still hold the name
+        DROP INDEX IF EXISTS "{{ this.schema }}"."{{ name }}";
+        CREATE {% if index.get('unique') %}UNIQUE {% endif %}INDEX "{{ name }}"
+            ON {{ this }} USING {{ index.get('type', 'btree') }} ({{ index['columns'] | join(', ') }})
+            {%- if index.get('where') %} WHERE {{ index['where'] }}{% endif %};
+        COMMENT ON INDEX "{{ this.schema }}"."{{ name }}" IS 'managed by apply_indexes';
+            {%- endif -%}
+        {%- endfor -%}
+
+        {%- for name in existing if name not in wanted %}
+        DROP INDEX IF EXISTS "{{ this.schema }}"."{{ name }}";
+        {%- endfor %}
+
+        {%- set analyze = meta.get('analyze', []) -%}
+        {%- if analyze is sameas true %}
+        ANALYZE {{ this }};
+        {%- else -%}
+            {%- set columns = [] -%}
+            {%- for column in declared | map(attribute='columns') | sum(start=[]) + analyze if column not in columns -%}
+                {%- do columns.append(column) -%}
+            {%- endfor %}
+        ANALYZE {{ this }} ({{ columns | join(', ') }});
+        {%- endif -%}
+    {%- endif -%}
+{% endmacro %}
+
+-- Macro: Report how often the analytics queries use the managed indexes
+-- Counters restart whenever a table is rebuilt, so right after `dbt run` they
+-- reflect the analytics models built on top. Incremental tables keep their
+-- counters; pass reset: true, run the analytics models, then report again.
+--   dbt run-operation index_usage_report
+--   dbt run-operation index_usage_report --args '{reset: true}'
+{% macro index_usage_report(reset=false) %}
+    {% set usage_query %}
+        SELECT
+            s.schemaname,
+            s.relname,
+            s.indexrelname,
+            s.indexrelid,
+            s.idx_scan,
+            s.idx_tup_read,
+            pg_relation_size(s.indexrelid) AS index_bytes,
+            pg_get_indexdef(s.indexrelid) AS definition
+        FROM pg_stat_user_indexes s
+        WHERE obj_description(s.indexrelid, 'pg_class') = 'managed by apply_indexes'
+        ORDER BY s.schemaname, s.relname, s.indexrelname
+    {% endset %}
+    {% set usage = run_query(usage_query) %}
+
+    {% if reset %}
+        {% for indexrelid in usage.columns['indexrelid'].values() %}
+            {% do run_query("SELECT pg_stat_reset_single_table_counters(" ~ indexrelid ~ ")") %}
+        {% endfor %}
+        {{ log("Reset the counters of " ~ usage.rows | length ~ " managed indexes", info=true) }}
+        {{ return('') }}
+    {% endif %}
+
+    {% for row in usage.rows %}
+        {{ log(("USED   " if row['idx_scan'] > 0 else "UNUSED ")
+               ~ row['schemaname'] ~ "." ~ row['indexrelname']
+               ~ ": " ~ row['idx_scan'] ~ " scans, " ~ row['idx_tup_read'] ~ " tuples, "
+               ~ "%.1f" | format(row['index_bytes'] / 1048576) ~ " MB  -- " ~ row['definition'], info=true) }}
+    {% endfor %}
+    {% if usage.rows | length == 0 %}
+        {{ log("No managed indexes found; declare them under config.meta.indexes", info=true) }}
+    {% endif %}
+{% endmacro %}
@@ -0,0 +1,174 @@
+-- ===================================================================
+-- Materialized View Materialization (Postgres)
+-- ===================================================================
+
+-- Builds the model as a materialized view that readers never see missing or
+-- locked for longer than a rename:
+--   - with a unique_key (column or list) a unique index is created on it and
+--     later runs use REFRESH MATERIALIZED VIEW CONCURRENTLY, which leaves the
+--     view readable during the refresh
+--   - without one, or when the model SQL or unique_key changed, a new view is
+--     built next to the old one and swapped in by rename
+--   - the refresh is skipped when no upstream table changed since the last
+--     one. Upstream tables are found through the view's dependencies (through
+--     views and partitions) and fingerprinted by oid, file node, size and
+--     write counters; flush_table_stats publishes those counters as soon as
+--     each model commits. Models whose SQL uses CURRENT_DATE or NOW() also
+--     refresh when the date changes, so relative windows move forward;
+--     refresh_on_change_only=false refreshes on every run.
+-- The SQL hash and upstream fingerprint are kept in the view's comment, so
+-- persist_docs only applies to its columns.
+--
+--   config(materialized='materialized_view', unique_key=['year', 'month'])
+
+-- Macro: Flush this session's table statistics when its transaction ends
+-- Without it the write counters of a model can lag the next model by a second.
+{% macro flush_table_stats() %}
+    {%- if execute and config.get('materialized') != 'view' -%}
+        SELECT pg_stat_force_next_flush()
+    {%- endif -%}
+{% endmacro %}
+
+-- Macro: Fingerprint of the base tables a materialized view reads from
+{% macro materialized_view_upstream_fingerprint(relation, include_date=false) %}
+    {% set fingerprint_query %}
+        WITH RECURSIVE upstream(oid) AS (
+            SELECT '{{ relation }}'::regclass::oid
+            UNION
+            SELECT dependency.oid
+            FROM upstream u
+            CROSS JOIN LATERAL (
+                SELECT d.refobjid
+                FROM pg_rewrite r
+                JOIN pg_depend d
+                  ON d.classid = 'pg_rewrite'::regclass
+                 AND d.objid = r.oid
+                 AND d.refclassid = 'pg_class'::regclass
+                WHERE r.ev_class = u.oid
+                  AND d.refobjid <> u.oid
+                UNION ALL
+                SELECT i.inhrelid
+                FROM pg_inherits i
+                WHERE i.inhparent = u.oid
+            ) AS dependency(oid)
+        )
+        SELECT MD5(COALESCE(STRING_AGG(
+            CONCAT_WS(':', c.oid, c.relfilenode, pg_relation_size(c.oid),
+                      s.n_tup_ins, s.n_tup_upd, s.n_tup_del),
+            ',' ORDER BY c.oid), '')
+            {%- if include_date %} || CURRENT_DATE::TEXT{% endif %})
+        FROM upstream u
+        JOIN pg_class c ON c.oid = u.oid
+        LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+        WHERE c.relkind IN ('r', 'm')
+          AND c.oid <> '{{ relation }}'::regclass
+    {% endset %}
+    {{ return(run_query(fingerprint_query).columns[0].values()[0]) }}
+{% endmacro %}
+
+{% macro materialized_view_state(relation) %}
+    {%- set comment = run_query(
+        "SELECT obj_description('" ~ relation ~ "'::regclass, 'pg_class')").columns[0].values()[0] -%}
+    {%- set state = {} -%}
+    {%- for part in (comment or '').split(' ') if ':' in part -%}
+        {%- do state.update({part.split(':')[0]: part.split(':')[1]}) -%}
+    {%- endfor -%}
+    {{ return(state) }}
+{% endmacro %}
+
+{% materialization materialized_view, adapter='postgres' %}
+
+    {%- set unique_key = config.get('unique_key') -%}
+    {%- set unique_keys = [unique_key] if unique_key is string else (unique_key or []) -%}
+    {%- set grant_config = config.get('grants') -%}
+    {%- set refresh_on_change_only = config.get('refresh_on_change_only', true) -%}
+    {%- set date_relative = modules.re.search('(?i)\\b(current_date|now\\s*\\()', sql) is not none -%}
+
+    {%- set existing_relation = load_cached_relation(this) -%}
+    {%- set target_relation = this.incorporate(type='materialized_view') -%}
+    {%- set intermediate_relation = make_intermediate_relation(target_relation) -%}
+    {%- set backup_relation = make_backup_relation(target_relation,
+            existing_relation.type if existing_relation is not none else 'materialized_view') -%}
+    {%- set index_name = target_relation.identifier[:55] ~ '_ukey' -%}
+    {%- set intermediate_index_name = target_relation.identifier[:51] ~ '_ukey_new' -%}
+    {%- set sql_hash = local_md5(sql ~ '|' ~ unique_keys | join(',')) -%}
+
+    -- Leftovers of an interrupted run
+    {{ drop_relation_if_exists(load_cached_relation(intermediate_relation)) }}
+    {{ drop_relation_if_exists(load_cached_relation(backup_relation)) }}
+
+    {%- set rebuild = existing_relation is none or should_full_refresh()
+                      or existing_relation.type != 'materialized_view' or not unique_keys -%}
+    {%- if not rebuild -%}
+        {%- set state = materialized_view_state(existing_relation) -%}
+        {%- set rebuild = state.get('sql') != sql_hash -%}
+    {%- endif -%}
+
+    {{ run_hooks(pre_hooks, inside_transaction=False) }}
+
+    -- `BEGIN` happens here:
+    {{ run_hooks(pre_hooks, inside_transaction=True) }}
+
+    {% if rebuild %}
+        -- Created empty first so the fingerprint predates the data it describes
+        {% call statement('create_intermediate') -%}
+            CREATE MATERIALIZED VIEW {{ intermediate_relation }} AS
+            {{ sql }}
+            WITH NO DATA
+        {%- endcall %}
+        {% set fingerprint = materialized_view_upstream_fingerprint(intermediate_relation, date_relative) %}
+
+        {% call statement('main') -%}
+            REFRESH MATERIALIZED VIEW {{ intermediate_relation }}
+        {%- endcall %}
+        {% call statement('finish_intermediate') -%}
+            {% if unique_keys %}
+            CREATE UNIQUE INDEX "{{ intermediate_index_name }}"
+                ON {{ intermediate_relation }} ({{ unique_keys | join(', ') }});
+            {% endif %}
+            COMMENT ON MATERIALIZED VIEW {{ intermediate_relation }}
+                IS 'sql:{{ sql_hash }} upstream:{{ fingerprint }}'
+        {%- endcall %}
+
+        -- Readers only wait for the renames below
+        {% if existing_relation is not none %}
+            {{ adapter.rename_relation(existing_relation, backup_relation) }}
+        {% endif %}
+        {{ adapter.rename_relation(intermediate_relation, target_relation) }}
+        {% do adapter.drop_relation(backup_relation) %}
+        {% if unique_keys %}
+            {% call statement('rename_index') -%}
+                ALTER INDEX "{{ target_relation.schema }}"."{{ intermediate_index_name }}" RENAME TO "{{ index_name }}"
+            {%- endcall %}
+        {% endif %}
+
+    {% else %}
+        {% set fingerprint = materialized_view_upstream_fingerprint(target_relation, date_relative) %}
+        {% if refresh_on_change_only and fingerprint == state.get('upstream') %}
+            {{ log(target_relation ~ ": upstream unchanged, refresh skipped") }}
+            {% call noop_statement('main', 'SKIP upstream unchanged') %}{% endcall %}
+        {% else %}
+            {% call statement('main') -%}
+                REFRESH MATERIALIZED VIEW CONCURRENTLY {{ target_relation }}
+            {%- endcall %}
+            {% call statement('record_state') -%}
+                COMMENT ON MATERIALIZED VIEW {{ target_relation }}
+                    IS 'sql:{{ sql_hash }} upstream:{{ fingerprint }}'
+            {%- endcall %}
+        {% endif %}
+    {% endif %}
+
+    {{ run_hooks(post_hooks, inside_transaction=True) }}
+
+    {% set should_revoke = should_revoke(existing_relation, full_refresh_mode=rebuild) %}
+    {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
+
+    {% do persist_docs(target_relation, model, for_relation=false) %}
+
+    -- `COMMIT` happens here
+    {{ adapter.commit() }}
+
+    {{ run_hooks(post_hooks, inside_transaction=False) }}
+
+    {{ return({'relations': [target_relation]}) }}
+{% endmaterialization %}
@@ -0,0 +1,217 @@
+-- ===================================================================
+-- Monthly Range-Partitioned Incremental Materialization (Postgres)
+-- ===================================================================
+
+-- Builds the model as a table partitioned by month on partition_by, with one
+-- partition per month ({{ this }}_pYYYYMM) plus a default partition for NULL
+-- dates. Each batch is staged into a temp table first:
+--   - partitions for the staged months and the next partitions_ahead months
+--     are created if missing
+--   - partition_strategy 'merge' (default with a unique_key) deletes matching
+--     keys inside the staged date range only, so the delete prunes to the
+--     affected partitions, then inserts
+--   - partition_strategy 'replace' (default without one) truncates the staged
+--     months' partitions and reloads them
+--   - partition_strategy 'reload' truncates every partition and reloads the
+--     table from the staged rows, for models that select all of their source
+--     on every run
+--   - with partition_retention_months, partitions older than the window are
+--     detached and moved to partition_archive_schema (<schema>_archive), and
+--     staged rows older than the window are not loaded
+-- The partition column must not change for a given unique_key. Run with
+-- --full-refresh after changing the model's columns.
+--
+--   config(materialized='partitioned_incremental', partition_by='transaction_date',
+--          unique_key='transaction_key', partitions_ahead=3)
+
+{% macro is_partitioned(relation) %}
+    {%- if relation is none -%}
+        {{ return(false) }}
+    {%- endif -%}
+    {%- set result = run_query(
+        "SELECT COUNT(*) FROM pg_partitioned_table WHERE partrelid = to_regclass('" ~ relation ~ "')") -%}
+    {{ return(result.columns[0].values()[0] > 0) }}
+{% endmacro %}
+
+-- Macro: is_incremental, extended to partitioned_incremental models
+-- A model switching to the materialization is still rebuilt in full until its
+-- table is partitioned.
+{% macro is_incremental() %}
+    {%- if execute and model.config.materialized == 'partitioned_incremental' -%}
+        {%- set relation = adapter.get_relation(this.database, this.schema, this.table) -%}
+        {{ return(relation is not none and not should_full_refresh() and is_partitioned(relation)) }}
+    {%- endif -%}
+    {{ return(dbt.is_incremental()) }}
+{% endmacro %}
+
+{% macro partition_relation(relation, suffix) %}
+    {{ return(api.Relation.create(database=relation.database, schema=relation.schema,
+                                  identifier=relation.identifier ~ '_p' ~ suffix, type='table')) }}
+{% endmacro %}
+
+{% materialization partitioned_incremental, adapter='postgres' %}
+
+    {%- set partition_by = config.require('partition_by') -%}
+    {%- set unique_key = config.get('unique_key') -%}
+    {%- set strategy = config.get('partition_strategy', 'merge' if unique_key else 'replace') -%}
+    {%- set partitions_ahead = config.get('partitions_ahead', 3) -%}
+    {%- set retention_months = config.get('partition_retention_months') -%}
+    {%- set archive_schema = config.get('partition_archive_schema', this.schema ~ '_archive') -%}
+    {%- set grant_config = config.get('grants') -%}
+
+    {%- if strategy not in ['merge', 'replace', 'reload'] or (strategy == 'merge' and not unique_key) -%}
+        {{ exceptions.raise_compiler_error("partitioned_incremental: partition_strategy must be 'replace', 'reload', or 'merge' with a unique_key") }}
+    {%- endif -%}
+    {%- set unique_keys = [unique_key] if unique_key is string else (unique_key or []) -%}
+
+    {%- set existing_relation = load_cached_relation(this) -%}
+    {%- set target_relation = this.incorporate(type='table') -%}
+    {%- set staging_relation = make_temp_relation(target_relation) -%}
+    {%- set full_refresh = existing_relation is none or should_full_refresh()
+                           or not is_partitioned(existing_relation) -%}
+    {%- set cutoff = none -%}
+    {%- if retention_months is not none -%}
+        {%- set cutoff = "DATE_TRUNC('month', CURRENT_DATE) - INTERVAL '" ~ retention_months ~ " months'" -%}
+    {%- endif -%}
+
+    {{ run_hooks(pre_hooks, inside_transaction=False) }}
+
+    -- `BEGIN` happens here:
+    {{ run_hooks(pre_hooks, inside_transaction=True) }}
+
+    {% call statement('stage') -%}
+        {{ get_create_table_as_sql(True, staging_relation, sql) }}
+        {%- if cutoff is not none %};
+        DELETE FROM {{ staging_relation }} WHERE {{ partition_by }} < {{ cutoff }}
+        {%- endif %}
+    {%- endcall %}
+
+    {% if full_refresh %}
+        {% if existing_relation is not none %}
+            {% do adapter.drop_relation(existing_relation) %}
+        {% endif %}
+        {% call statement('create_parent') -%}
+            CREATE TABLE {{ target_relation }} (LIKE {{ staging_relation }})
+                PARTITION BY RANGE ({{ partition_by }});
+            CREATE TABLE {{ partition_relation(target_relation, 'default') }}
+                PARTITION OF {{ target_relation }} DEFAULT;
+        {%- endcall %}
+    {% endif %}
+
+    -- Staged months plus the months ahead, skipping partitions that exist
+    {% set months_query %}
+        WITH months AS (
+            SELECT DISTINCT DATE_TRUNC('month', {{ partition_by }})::DATE AS month_start
+            FROM {{ staging_relation }}
+            WHERE {{ partition_by }} IS NOT NULL
+            UNION
+            SELECT (DATE_TRUNC('month', CURRENT_DATE) + n * INTERVAL '1 month')::DATE
+            FROM GENERATE_SERIES(0, {{ partitions_ahead }}) AS n
+        )
+        SELECT
+            TO_CHAR(month_start, 'YYYYMM') AS suffix,
+            month_start::TEXT AS lower_bound,
+            (month_start + INTERVAL '1 month')::DATE::TEXT AS upper_bound
+        FROM months
+        WHERE TO_CHAR(month_start, 'YYYYMM') NOT IN (
+            SELECT RIGHT(c.relname, 6)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = '{{ target_relation }}'::regclass
+        )
+        ORDER BY 1
+    {% endset %}
+    {% set missing_months = run_query(months_query) %}
+    {% if missing_months.rows | length > 0 %}
+        {% call statement('create_partitions') -%}
+            {% for month in missing_months.rows %}
+            CREATE TABLE {{ partition_relation(target_relation, month['suffix']) }}
+                PARTITION OF {{ target_relation }}
+                FOR VALUES FROM ('{{ month['lower_bound'] }}') TO ('{{ month['upper_bound'] }}');
+            {% endfor %}
+        {%- endcall %}
+    {% endif %}
+
+    {%- set dest_columns = adapter.get_columns_in_relation(target_relation) -%}
+    {%- set dest_cols_csv = dest_columns | map(attribute='quoted') | join(', ') -%}
+
+    {% if not full_refresh %}
+        {% set range_query %}
+            SELECT MIN({{ partition_by }})::TEXT, MAX({{ partition_by }})::TEXT,
+                   COUNT(*) FILTER (WHERE {{ partition_by }} IS NULL)
+            FROM {{ staging_relation }}
+        {% endset %}
+        {% set staged_range = run_query(range_query).rows[0] %}
+
+        {% set clear_sql %}
+            {% if strategy == 'reload' %}
+            TRUNCATE {{ target_relation }};
+            {% elif strategy == 'merge' and staged_range[0] is not none %}
+            DELETE FROM {{ target_relation }} AS target
+            USING {{ staging_relation }} AS staged
+            WHERE {% for key in unique_keys %}target.{{ key }} = staged.{{ key }} AND {% endfor %}
+                  target.{{ partition_by }} >= '{{ staged_range[0] }}'
+              AND target.{{ partition_by }} <= '{{ staged_range[1] }}';
+            {% elif strategy == 'replace' and staged_range[0] is not none %}
+                {%- set staged_months = run_query(
+                    "SELECT DISTINCT TO_CHAR(" ~ partition_by ~ ", 'YYYYMM') FROM " ~ staging_relation
+                    ~ " WHERE " ~ partition_by ~ " IS NOT NULL").columns[0].values() %}
+            TRUNCATE {% for month in staged_months %}{{ partition_relation(target_relation, month) }}{% if not loop.last %}, {% endif %}{% endfor %};
+            {% endif %}
+            {% if staged_range[2] > 0 and strategy != 'reload' %}
+            DELETE FROM {{ partition_relation(target_relation, 'default') }} AS target
+            {% if strategy == 'merge' %}
+            USING {{ staging_relation }} AS staged
+            WHERE {% for key in unique_keys %}target.{{ key }} = staged.{{ key }}{% if not loop.last %} AND {% endif %}{% endfor %}
+            {% endif %};
+            {% endif %}
+        {% endset %}
+        {% if clear_sql | trim %}
+            {% call statement('clear_affected') %}{{ clear_sql }}{% endcall %}
+        {% endif %}
+    {% endif %}
+
+    -- Tuple routing only touches the partitions of the staged months
+    {% call statement('main') -%}
+        INSERT INTO {{ target_relation }} ({{ dest_cols_csv }})
+        SELECT {{ dest_cols_csv }} FROM {{ staging_relation }}
+    {%- endcall %}
+
+    {% if cutoff is not none %}
+        {% set expired_query %}
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = '{{ target_relation }}'::regclass
+              AND c.relname ~ '_p[0-9]{6}$'
+              AND RIGHT(c.relname, 6) < TO_CHAR({{ cutoff }}, 'YYYYMM')
+            ORDER BY 1
+        {% endset %}
+        {% set expired = run_query(expired_query).columns[0].values() %}
+        {% if expired | length > 0 %}
+            {% call statement('archive_partitions') -%}
+                CREATE SCHEMA IF NOT EXISTS {{ archive_schema }};
+                {% for name in expired %}
+                ALTER TABLE {{ target_relation }} DETACH PARTITION {{ target_relation.schema }}.{{ name }};
+                DROP TABLE IF EXISTS {{ archive_schema }}.{{ name }};
+                ALTER TABLE {{ target_relation.schema }}.{{ name }} SET SCHEMA {{ archive_schema }};
+                {% endfor %}
+            {%- endcall %}
+            {{ log("Archived " ~ expired | length ~ " partitions of " ~ target_relation ~ " to " ~ archive_schema, info=true) }}
+        {% endif %}
+    {% endif %}
+
+    {{ run_hooks(post_hooks, inside_transaction=True) }}
+
+    {% set should_revoke = should_revoke(existing_relation, full_refresh_mode=full_refresh) %}
+    {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
+
+    {% do persist_docs(target_relation, model) %}
+
+    -- `COMMIT` happens here
+    {{ adapter.commit() }}
+
+    {{ run_hooks(post_hooks, inside_transaction=False) }}
+
+    {{ return({'relations': [target_relation]}) }}
+{% endmaterialization %}
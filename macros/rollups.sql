@@ -0,0 +1,50 @@
+-- ===================================================================
+-- Rollup Helpers for the Real-time Views
+-- ===================================================================
+
+-- Upper bounds (ms) of the processing-time histogram buckets; anything above
+-- the last bound lands in an overflow bucket
+{% macro latency_histogram_bounds() %}
+    {{ return([100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 4000, 5000, 7500, 10000]) }}
+{% endmacro %}
+
+-- Macro: Histogram bucket counts, one column per bucket (rollup side)
+{% macro latency_histogram(column) %}
+    {%- set bounds = latency_histogram_bounds() -%}
+    {%- for bound in bounds %}
+        COUNT(*) FILTER (WHERE {{ column }} <= {{ bound }}
+            {%- if not loop.first %} AND {{ column }} > {{ bounds[loop.index0 - 1] }}{% endif %}) AS latency_le_{{ bound }}ms,
+    {%- endfor %}
+        COUNT(*) FILTER (WHERE {{ column }} > {{ bounds[-1] }}) AS latency_gt_{{ bounds[-1] }}ms
+{%- endmacro %}
+
+-- Macro: Sum the histogram columns of the rollup rows matching a condition
+{% macro latency_histogram_sum(condition='TRUE') %}
+    {%- set bounds = latency_histogram_bounds() -%}
+    {%- for bound in bounds %}
+        COALESCE(SUM(latency_le_{{ bound }}ms) FILTER (WHERE {{ condition }}), 0) AS latency_le_{{ bound }}ms,
+    {%- endfor %}
+        COALESCE(SUM(latency_gt_{{ bounds[-1] }}ms) FILTER (WHERE {{ condition }}), 0) AS latency_gt_{{ bounds[-1] }}ms
+{%- endmacro %}
+
+-- Macro: Percentile from summed histogram columns
+-- Interpolates linearly inside the bucket holding the percentile; NULL when
+-- the histogram is empty, the last bound when it falls in the overflow bucket.
+{% macro histogram_percentile(fraction) %}
+    {%- set bounds = latency_histogram_bounds() -%}
+    {%- set columns = [] -%}
+    {%- for bound in bounds -%}
+        {%- do columns.append('latency_le_' ~ bound ~ 'ms') -%}
+    {%- endfor -%}
+    {%- set target = fraction ~ ' * (' ~ (columns + ['latency_gt_' ~ bounds[-1] ~ 'ms']) | join(' + ') ~ ')' -%}
+    CASE
+    {%- for bound in bounds %}
+        {%- set lower = 0 if loop.first else bounds[loop.index0 - 1] %}
+        {%- set below = '0' if loop.first else columns[:loop.index0] | join(' + ') %}
+        WHEN {{ columns[:loop.index] | join(' + ') }} >= {{ target }}
+            THEN {{ lower }} + ({{ target }} - ({{ below }}))
+                 / NULLIF({{ columns[loop.index0] }}, 0) * {{ bound - lower }}
+    {%- endfor %}
+        ELSE {{ bounds[-1] }}
+    END
+{%- endmacro %}
@@ -0,0 +1,152 @@
+-- ===================================================================
+-- Integer Surrogate Keys for the Gold Layer
+-- ===================================================================
+
+-- Macro: Deterministic 64-bit surrogate key
+--   kind='id'   : single integer natural id passed through as BIGINT. With a
+--                 prefix (1-127) the entity type sits in the top byte, so ids
+--                 of different entities sharing a dimension cannot collide.
+--   kind='date' : YYYYMMDD INTEGER, the usual date-dimension key
+--   kind='hash' : first 64 bits of the MD5 of the fields, for text or
+--                 composite keys
+-- kind='id' and kind='date' give a NULL key for a NULL input. kind='hash'
+-- hashes NULL fields as '_null_', so composite keys with missing parts still
+-- get a non-NULL key, like the dbt_utils keys. Set var surrogate_key_type:
+-- 'md5' to keep the old dbt_utils text keys while tables are migrated; date
+-- keys then hash the fields cast to DATE, like the old fact keys and dim_date.
+{% macro integer_surrogate_key(field_list, kind='id', prefix=none) %}
+    {%- if var('surrogate_key_type', 'bigint') == 'md5' -%}
+        {%- if kind == 'date' -%}
+            {%- set date_fields = [] -%}
+            {%- for field in field_list -%}
+                {%- do date_fields.append('CAST(' ~ field ~ ' AS DATE)') -%}
+            {%- endfor -%}
+            {{ dbt_utils.generate_surrogate_key(date_fields) }}
+        {%- else -%}
+            {{ dbt_utils.generate_surrogate_key(field_list) }}
+        {%- endif -%}
+    {%- elif kind == 'id' -%}
+        {%- if field_list | length != 1 -%}
+            {{ exceptions.raise_compiler_error("integer_surrogate_key: kind='id' takes exactly one field, use kind='hash' for composite keys") }}
+        {%- endif -%}
+        {%- if prefix is none -%}
+            CAST({{ field_list[0] }} AS BIGINT)
+        {%- else -%}
+            ((CAST({{ prefix }} AS BIGINT) << 56) | CAST({{ field_list[0] }} AS BIGINT))
+        {%- endif -%}
+    {%- elif kind == 'date' -%}
+        CAST(DATE_PART('year', {{ field_list[0] }}) * 10000
+             + DATE_PART('month', {{ field_list[0] }}) * 100
+             + DATE_PART('day', {{ field_list[0] }}) AS INTEGER)
+    {%- elif kind == 'hash' -%}
+        ('x' || SUBSTR(
+            MD5(
+                {%- for field in field_list %}
+                COALESCE(CAST({{ field }} AS TEXT), '_null_')
+                {%- if not loop.last %} || '-' ||{% endif %}
+                {%- endfor %}
+            ), 1, 16))::BIT(64)::BIGINT
+    {%- else -%}
+        {{ exceptions.raise_compiler_error("integer_surrogate_key: unknown kind '" ~ kind ~ "'") }}
+    {%- endif -%}
+{% endmacro %}
+
+-- Macro: Drop gold tables that still carry text (MD5) surrogate keys
+-- Incremental facts would otherwise keep appending integer keys into their
+-- old text columns. Dropped tables are rebuilt in full by the next dbt run;
+-- dependent views are dropped with them and rebuilt as well.
+--   dbt run-operation migrate_surrogate_keys                       (list only)
+--   dbt run-operation migrate_surrogate_keys --args '{dry_run: false}'
+{% macro migrate_surrogate_keys(schema='gold', dry_run=true) %}
+    {% set stale_query %}
+        SELECT DISTINCT c.table_name
+        FROM information_schema.columns c
+        JOIN information_schema.tables t
+          ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+        WHERE c.table_schema = '{{ schema }}'
+          AND t.table_type = 'BASE TABLE'
+          AND c.column_name LIKE '%\_key'
+          AND c.column_name NOT LIKE '%natural\_key'
+          AND c.data_type IN ('text', 'character varying')
+        ORDER BY 1
+    {% endset %}
+    {% set stale = run_query(stale_query).columns[0].values() %}
+
+    {% if stale | length == 0 %}
+        {{ log("No tables in " ~ schema ~ " carry text surrogate keys", info=true) }}
+    {% endif %}
+    {% for table in stale %}
+        {% if dry_run %}
+            {{ log("Would drop " ~ schema ~ "." ~ table ~ " (text surrogate keys)", info=true) }}
+        {% else %}
+            {% do run_query("DROP TABLE IF EXISTS " ~ schema ~ "." ~ table ~ " CASCADE") %}
+            {{ log("Dropped " ~ schema ~ "." ~ table ~ "; the next dbt run rebuilds it", info=true) }}
+        {% endif %}
+    {% endfor %}
+{% endmacro %}
+
+-- Macro: Before/after benchmark of MD5 text keys against integer keys
+-- Builds fact_transactions- and dim_customer-shaped temp tables both ways
+-- from silver and reports build time, table size (with key indexes) and the
+-- latency of the fact-to-dimension join.
+--   dbt run-operation benchmark_surrogate_keys
+{% macro benchmark_surrogate_keys(runs=3) %}
+    {% set variants = {
+        'md5': {
+            'transaction': dbt_utils.generate_surrogate_key(['transaction_id']),
+            'customer': dbt_utils.generate_surrogate_key(['customer_id']),
+            'account': dbt_utils.generate_surrogate_key(['account_id']),
+            'merchant': dbt_utils.generate_surrogate_key(['merchant_id']),
+            'date': dbt_utils.generate_surrogate_key(['transaction_date::date']),
+        },
+        'bigint': {
+            'transaction': integer_surrogate_key(['transaction_id']),
+            'customer': integer_surrogate_key(['customer_id']),
+            'account': integer_surrogate_key(['account_id']),
+            'merchant': integer_surrogate_key(['merchant_id']),
+            'date': integer_surrogate_key(['transaction_date'], kind='date'),
+        },
+    } %}
+    {% set dim_keys = {
+        'md5': dbt_utils.generate_surrogate_key(['customer_id']),
+        'bigint': integer_surrogate_key(['customer_id']),
+    } %}
+
+    {% for variant, keys in variants.items() %}
+        {% do run_query("DROP TABLE IF EXISTS bench_fact_" ~ variant ~ ", bench_dim_" ~ variant) %}
+
+        {% set started = modules.datetime.datetime.now() %}
+        {% do run_query(
+            "CREATE TABLE bench_fact_" ~ variant ~ " AS SELECT "
+            ~ keys['transaction'] ~ " AS transaction_key, "
+            ~ keys['customer'] ~ " AS customer_key, "
+            ~ keys['account'] ~ " AS account_key, "
+            ~ keys['merchant'] ~ " AS merchant_key, "
+            ~ keys['date'] ~ " AS date_key, amount "
+            ~ "FROM " ~ ref('stg_transactions')) %}
+        {% set build_seconds = (modules.datetime.datetime.now() - started).total_seconds() %}
+
+        {% do run_query("CREATE TABLE bench_dim_" ~ variant ~ " AS SELECT " ~ dim_keys[variant]
+                        ~ " AS customer_key, customer_segment FROM " ~ ref('stg_customers')) %}
+        {% do run_query("CREATE UNIQUE INDEX ON bench_fact_" ~ variant ~ " (transaction_key)") %}
+        {% do run_query("CREATE INDEX ON bench_fact_" ~ variant ~ " (customer_key)") %}
+        {% do run_query("CREATE UNIQUE INDEX ON bench_dim_" ~ variant ~ " (customer_key)") %}
+        {% do run_query("ANALYZE bench_fact_" ~ variant ~ "; ANALYZE bench_dim_" ~ variant) %}
+        {% set size = run_query("SELECT pg_total_relation_size('bench_fact_" ~ variant ~ "')").columns[0].values()[0] %}
+
+        {% set join_seconds = [] %}
+        {% for run in range(runs) %}
+            {% set started = modules.datetime.datetime.now() %}
+            {% do run_query("SELECT d.customer_segment, SUM(f.amount) FROM bench_fact_" ~ variant
+                            ~ " f JOIN bench_dim_" ~ variant ~ " d ON f.customer_key = d.customer_key"
+                            ~ " GROUP BY d.customer_segment") %}
+            {% do join_seconds.append((modules.datetime.datetime.now() - started).total_seconds()) %}
+        {% endfor %}
+
+        {{ log(variant ~ ": build " ~ "%.2f" | format(build_seconds) ~ "s, size "
+               ~ "%.1f" | format(size / 1048576) ~ " MB, join "
+               ~ "%.3f" | format(join_seconds | min) ~ "s (best of " ~ runs ~ ")", info=true) }}
+
+        {% do run_query("DROP TABLE bench_fact_" ~ variant ~ ", bench_dim_" ~ variant) %}
+    {% endfor %}
+{% endmacro %}
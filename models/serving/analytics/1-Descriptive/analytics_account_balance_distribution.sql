@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='balance_category',
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'accounts']
     )
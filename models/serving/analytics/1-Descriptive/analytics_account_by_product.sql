@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='product_name',
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'accounts']
     )
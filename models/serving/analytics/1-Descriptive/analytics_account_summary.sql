@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='total_accounts',
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'accounts']
     )
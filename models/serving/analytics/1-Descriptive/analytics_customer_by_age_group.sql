@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='age_group',
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'customer']
     )
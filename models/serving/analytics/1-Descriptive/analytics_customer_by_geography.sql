@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['state', 'city'],
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'customer']
     )
@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='total_customers',
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'customer']
     )
@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='transaction_date',
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'transactions']
     )
@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='total_alerts',
         schema="gold",
         tags=['analytics', 'descriptive', 'insertion', 'fraud']
     )
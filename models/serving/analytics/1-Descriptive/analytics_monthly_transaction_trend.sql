@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['year', 'month'],
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'transactions']
     )
@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='merchant_category',
         schema="gold",
         tags=['analytics', 'descriptive', 'serving', 'transactions']
     )
@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['product_category', 'customer_segment', 'churn_risk_category'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'accounts']
     )
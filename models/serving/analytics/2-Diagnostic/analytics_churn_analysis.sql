@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key='customer_segment',
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'churn']
     )
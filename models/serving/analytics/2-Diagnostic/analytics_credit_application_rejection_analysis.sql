@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['decision', 'risk_grade', 'dti_category', 'credit_score_band', 'income_bracket', 'employment_status', 'product_name'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'credit']
     )
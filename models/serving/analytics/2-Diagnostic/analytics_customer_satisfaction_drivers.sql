@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['interaction_type', 'reason', 'duration_category', 'issue_severity'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'service']
     )
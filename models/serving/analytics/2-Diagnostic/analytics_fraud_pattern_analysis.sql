@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['merchant_category', 'channel', 'is_international', 'day_name', 'hour_of_day'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'fraud']
     )
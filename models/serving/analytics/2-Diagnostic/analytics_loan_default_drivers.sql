@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['customer_segment', 'credit_score_band', 'income_bracket', 'employment_status', 'risk_level'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'loans']
     )
@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['campaign_type', 'target_segment', 'channel_group', 'roi_category', 'campaign_status'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'ingestion', 'marketing']
     )
@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['year_month', 'product_category', 'customer_segment'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'revenue']
     )
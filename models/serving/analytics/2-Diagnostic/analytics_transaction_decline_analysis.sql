@@ -1,6 +1,6 @@
 {{
     config(
-        materialized='table',
+        unique_key=['decline_reason', 'channel', 'merchant_category', 'is_international'],
         schema="gold",
         tags=['analytics', 'diagnostic', 'serving', 'transactions']
     )
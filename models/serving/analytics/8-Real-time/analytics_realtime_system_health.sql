@@ -6,29 +6,36 @@
     )
 }}
 
-WITH system_metrics AS (
+WITH window_totals AS (
     SELECT
         -- Transaction processing
-        COUNT(*) FILTER (WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '5 minutes') AS transactions_5min,
-        COUNT(*) FILTER (WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes') AS transactions_15min,
-        AVG(processing_time_ms) FILTER (WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes') AS avg_processing_time_ms,
-        PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY processing_time_ms) FILTER (WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes') AS p95_processing_time_ms,
-        
+        COALESCE(SUM(transaction_count) FILTER (WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '5 minutes')), 0) AS transactions_5min,
+        COALESCE(SUM(transaction_count), 0) AS transactions_15min,
+        SUM(processing_time_sum) * 1.0 / NULLIF(SUM(processing_time_count), 0) AS avg_processing_time_ms,
+        {{ latency_histogram_sum() }},
+
         -- Success rates
-        COUNT(*) FILTER (WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes' AND is_declined_flag = 0) * 100.0 / 
-            NULLIF(COUNT(*) FILTER (WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'), 0) AS success_rate_pct,
-        
+        (SUM(transaction_count) - SUM(declined_count)) * 100.0 / NULLIF(SUM(transaction_count), 0) AS success_rate_pct,
+
         -- Fraud detection
-        COUNT(*) FILTER (WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes' AND fraud_score >= 0.7) AS high_risk_transactions,
-        
+        COALESCE(SUM(high_risk_count), 0) AS high_risk_transactions,
+
         -- Channel health
-        COUNT(DISTINCT CASE WHEN transaction_date >= CURRENT_TIMESTAMP - INTERVAL '5 minutes' AND channel = 'Mobile' THEN transaction_key END) AS mobile_active,
-        COUNT(DISTINCT CASE WHEN transaction_date >= CURRENT_TIMESTAMP - INTERVAL '5 minutes' AND channel = 'Online' THEN transaction_key END) AS online_active,
-        COUNT(DISTINCT CASE WHEN transaction_date >= CURRENT_TIMESTAMP - INTERVAL '5 minutes' AND channel = 'ATM' THEN transaction_key END) AS atm_active,
-        COUNT(DISTINCT CASE WHEN transaction_date >= CURRENT_TIMESTAMP - INTERVAL '5 minutes' AND channel = 'Branch' THEN transaction_key END) AS branch_active
-        
-    FROM {{ ref('fact_transactions') }}
-    WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
+        COALESCE(SUM(transaction_count) FILTER (WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '5 minutes') AND channel = 'Mobile'), 0) AS mobile_active,
+        COALESCE(SUM(transaction_count) FILTER (WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '5 minutes') AND channel = 'Online'), 0) AS online_active,
+        COALESCE(SUM(transaction_count) FILTER (WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '5 minutes') AND channel = 'ATM'), 0) AS atm_active,
+        COALESCE(SUM(transaction_count) FILTER (WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '5 minutes') AND channel = 'Branch'), 0) AS branch_active
+
+    FROM {{ ref('fact_transactions_minute_rollup') }}
+    WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
+),
+
+system_metrics AS (
+    SELECT
+        *,
+        -- Estimated from the latency histogram
+        {{ histogram_percentile(0.95) }} AS p95_processing_time_ms
+    FROM window_totals
 )
 
 SELECT
@@ -9,79 +9,82 @@
 WITH realtime_metrics AS (
     SELECT
         -- Current hour metrics
-        COUNT(*) FILTER (
-            WHERE transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
-        ) AS transactions_current_hour,
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
+        ), 0) AS transactions_current_hour,
 
-        SUM(transaction_amount_abs) FILTER (
-            WHERE transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
+        SUM(amount_sum) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
         ) AS volume_current_hour,
 
         -- Last 15 minutes
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
-        ) AS transactions_last_15min,
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
+        ), 0) AS transactions_last_15min,
 
-        SUM(transaction_amount_abs) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
+        SUM(amount_sum) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
         ) AS volume_last_15min,
 
         -- Last 5 minutes
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '5 minutes'
-        ) AS transactions_last_5min,
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '5 minutes')
+        ), 0) AS transactions_last_5min,
 
         -- Alerts (Postgres-safe)
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
-              AND is_fraud_flag
-        ) AS fraud_alerts_15min,
+        COALESCE(SUM(fraud_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
+        ), 0) AS fraud_alerts_15min,
 
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
-              AND is_declined_flag  = 1
-        ) AS declined_15min,
+        COALESCE(SUM(declined_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
+        ), 0) AS declined_15min,
 
         -- Comparison to same hour yesterday
-        COUNT(*) FILTER (
-            WHERE transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP - INTERVAL '1 day')
-              AND transaction_date <  DATE_TRUNC('hour', CURRENT_TIMESTAMP - INTERVAL '1 day')
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP - INTERVAL '1 day')
+              AND minute_bucket <  DATE_TRUNC('hour', CURRENT_TIMESTAMP - INTERVAL '1 day')
                                    + INTERVAL '1 hour'
-        ) AS transactions_same_hour_yesterday,
+        ), 0) AS transactions_same_hour_yesterday,
 
         -- Average transaction amount
-        AVG(transaction_amount_abs) FILTER (
-            WHERE transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
-        ) AS avg_amount_current_hour,
-
-        -- Unique customers
-        COUNT(DISTINCT customer_key) FILTER (
-            WHERE transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
-        ) AS unique_customers_current_hour,
+        SUM(amount_sum) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
+        ) / NULLIF(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
+        ), 0) AS avg_amount_current_hour,
 
         -- Channel breakdown (last 15 min)
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
               AND channel = 'Mobile'
-        ) AS mobile_15min,
+        ), 0) AS mobile_15min,
 
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
               AND channel = 'Online'
-        ) AS online_15min,
+        ), 0) AS online_15min,
 
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
               AND channel = 'ATM'
-        ) AS atm_15min,
+        ), 0) AS atm_15min,
 
-        COUNT(*) FILTER (
-            WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes'
+        COALESCE(SUM(transaction_count) FILTER (
+            WHERE minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')
               AND channel = 'Branch'
-        ) AS branch_15min
-
-    FROM {{ ref('fact_transactions') }}
-    WHERE transaction_date >= CURRENT_TIMESTAMP - INTERVAL '25 hours'
+        ), 0) AS branch_15min
+
+    FROM {{ ref('fact_transactions_minute_rollup') }}
+    WHERE minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP - INTERVAL '1 day')
+),
+
+-- Unique customers
+current_hour_customers AS (
+    SELECT COUNT(DISTINCT customer_key) AS unique_customers_current_hour
+    FROM {{ ref('fact_merchant_minute_rollup') }},
+         UNNEST(customer_keys) AS customer_key
+    WHERE minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
 )
 
 SELECT
@@ -152,3 +155,4 @@ SELECT
     ROUND((online_15min * 100.0 / NULLIF(transactions_last_15min, 0))::numeric, 1) AS online_pct
 
 FROM realtime_metrics
+CROSS JOIN current_hour_customers
@@ -13,22 +13,44 @@ WITH merchant_activity AS (
         m.merchant_type,
         
         -- Current hour metrics
-        COUNT(*) FILTER (WHERE t.transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)) AS transactions_current_hour,
-        SUM(t.transaction_amount_abs) FILTER (WHERE t.transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)) AS volume_current_hour,
+        COALESCE(SUM(r.transaction_count) FILTER (WHERE r.minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)), 0) AS transactions_current_hour,
+        SUM(r.amount_sum) FILTER (WHERE r.minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)) AS volume_current_hour,
         
         -- Previous hour metrics
-        COUNT(*) FILTER (WHERE t.transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP) - INTERVAL '1 hour'
-                          AND t.transaction_date < DATE_TRUNC('hour', CURRENT_TIMESTAMP)) AS transactions_previous_hour,
+        COALESCE(SUM(r.transaction_count) FILTER (WHERE r.minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP) - INTERVAL '1 hour'
+                          AND r.minute_bucket < DATE_TRUNC('hour', CURRENT_TIMESTAMP)), 0) AS transactions_previous_hour,
         
         -- Last 15 minutes
-        COUNT(*) FILTER (WHERE t.transaction_date >= CURRENT_TIMESTAMP - INTERVAL '15 minutes') AS transactions_15min,
+        COALESCE(SUM(r.transaction_count) FILTER (WHERE r.minute_bucket >= DATE_TRUNC('minute', CURRENT_TIMESTAMP - INTERVAL '15 minutes')), 0) AS transactions_15min
         
-        COUNT(DISTINCT t.customer_key) FILTER (WHERE t.transaction_date >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)) AS unique_customers_current_hour
-        
-    FROM {{ ref('fact_transactions') }} t
-    INNER JOIN {{ ref('dim_merchant') }} m ON t.merchant_key = m.merchant_key
-    WHERE t.transaction_date >= CURRENT_TIMESTAMP - INTERVAL '2 hours'
+    FROM {{ ref('fact_merchant_minute_rollup') }} r
+    INNER JOIN {{ ref('dim_merchant') }} m ON r.merchant_key = m.merchant_key
+    WHERE r.minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP) - INTERVAL '1 hour'
     GROUP BY m.merchant_name, m.category, m.merchant_type
+),
+
+merchant_customers AS (
+    SELECT
+        m.merchant_name,
+        m.category,
+        m.merchant_type,
+        COUNT(DISTINCT c.customer_key) AS unique_customers_current_hour
+    FROM {{ ref('fact_merchant_minute_rollup') }} r
+    INNER JOIN {{ ref('dim_merchant') }} m ON r.merchant_key = m.merchant_key
+    CROSS JOIN UNNEST(r.customer_keys) AS c(customer_key)
+    WHERE r.minute_bucket >= DATE_TRUNC('hour', CURRENT_TIMESTAMP)
+    GROUP BY m.merchant_name, m.category, m.merchant_type
+),
+
+merchant_metrics AS (
+    SELECT
+        a.*,
+        COALESCE(c.unique_customers_current_hour, 0) AS unique_customers_current_hour
+    FROM merchant_activity a
+    LEFT JOIN merchant_customers c
+        ON a.merchant_name IS NOT DISTINCT FROM c.merchant_name
+       AND a.category IS NOT DISTINCT FROM c.category
+       AND a.merchant_type IS NOT DISTINCT FROM c.merchant_type
 )
 
 SELECT
@@ -62,7 +84,7 @@ SELECT
     
     CURRENT_TIMESTAMP AS snapshot_time
     
-FROM merchant_activity
+FROM merchant_metrics
 WHERE transactions_current_hour > 0
 ORDER BY transactions_current_hour DESC
 LIMIT 50
\ No newline at end of file
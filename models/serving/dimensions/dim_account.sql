@@ -8,7 +8,7 @@
 
 WITH account_enhanced AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['account_id']) }} AS account_key,
+        {{ integer_surrogate_key(['account_id']) }} AS account_key,
         account_id AS account_natural_key,
         customer_id,
         product_id,
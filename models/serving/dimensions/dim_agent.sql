@@ -29,7 +29,7 @@ agent_metrics AS (
 
 agent_enhanced AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['a.agent_id']) }} AS agent_key,
+        {{ integer_surrogate_key(['a.agent_id'], kind='hash') }} AS agent_key,
         a.agent_id AS agent_natural_key,
         
         -- Performance Metrics
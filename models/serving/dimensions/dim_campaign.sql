@@ -9,7 +9,7 @@
 
 WITH campaign_enhanced AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['campaign_id']) }} AS campaign_key,
+        {{ integer_surrogate_key(['campaign_id']) }} AS campaign_key,
         campaign_id AS campaign_natural_key,
         campaign_name,
         campaign_type,
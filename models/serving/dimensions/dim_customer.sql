@@ -50,7 +50,7 @@ WITH customer_current AS (
 
 customer_with_surrogate AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['customer_id']) }} AS customer_key,
         customer_id AS customer_natural_key,
         first_name,
         last_name,
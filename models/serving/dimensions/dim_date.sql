@@ -16,7 +16,7 @@ WITH date_spine AS (
 
 date_dimension AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['date_day']) }} AS date_key,
+        {{ integer_surrogate_key(['date_day'], kind='date') }} AS date_key,
         date_day AS date_actual,
         EXTRACT(YEAR FROM date_day) AS year,
         EXTRACT(QUARTER FROM date_day) AS quarter,
@@ -8,7 +8,7 @@
 
 WITH economic_enhanced AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['date']) }} AS economic_indicator_key,
+        {{ integer_surrogate_key(['date'], kind='date') }} AS economic_indicator_key,
         date AS indicator_date,
         year,
         quarter,
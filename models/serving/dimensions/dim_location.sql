@@ -7,7 +7,7 @@
 }}
 WITH branches AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['branch_id']) }} AS location_key,
+        {{ integer_surrogate_key(['branch_id'], prefix=1) }} AS location_key,
         branch_id AS location_natural_key,
         'BRANCH' AS location_type,
         branch_name AS location_name,
@@ -29,7 +29,7 @@ WITH branches AS (
 
 atms AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['atm_id']) }} AS location_key,
+        {{ integer_surrogate_key(['atm_id'], prefix=2) }} AS location_key,
         atm_id AS location_natural_key,
         'ATM' AS location_type,
         location_name,
@@ -8,7 +8,7 @@
 
 WITH merchant_enhanced AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['merchant_id']) }} AS merchant_key,
+        {{ integer_surrogate_key(['merchant_id']) }} AS merchant_key,
         merchant_id AS merchant_natural_key,
         merchant_name,
         category,
@@ -8,7 +8,7 @@
 
 WITH product_enhanced AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['product_id']) }} AS product_key,
+        {{ integer_surrogate_key(['product_id']) }} AS product_key,
         product_id AS product_natural_key,
         product_name,
         category,
@@ -7,23 +7,60 @@
     )
 }}
 
-WITH daily_snapshots AS (
+-- One row per account and snapshot date, for every date in the range:
+--   - snapshot_start_date / snapshot_end_date vars: backfill that range
+--     (dbt run -s fact_account_daily_snapshot --vars '{snapshot_start_date: 2024-01-01}')
+--   - incremental runs: the dates missing since the last snapshot, through today
+--   - first build: today only
+-- Transaction activity is per snapshot date; balances and statuses are the
+-- account's current values.
+WITH snapshot_dates AS (
+    SELECT series_date::DATE AS snapshot_date
+    FROM GENERATE_SERIES(
+        {% if var('snapshot_start_date') %}
+        '{{ var("snapshot_start_date") }}'::DATE,
+        {% elif is_incremental() %}
+        (SELECT COALESCE(MAX(snapshot_date) + 1, CURRENT_DATE) FROM {{ this }}),
+        {% else %}
+        CURRENT_DATE,
+        {% endif %}
+        {% if var('snapshot_end_date') %}'{{ var("snapshot_end_date") }}'::DATE{% else %}CURRENT_DATE{% endif %},
+        INTERVAL '1 day'
+    ) AS series_date
+),
+
+-- Single grouped scan; the range predicates use the transaction_date index
+daily_activity AS (
+    SELECT
+        account_id,
+        transaction_date::DATE AS activity_date,
+        COUNT(*) AS daily_transaction_count,
+        SUM(amount) AS daily_transaction_amount,
+        SUM(CASE WHEN amount < 0 THEN 1 ELSE 0 END) AS daily_debit_count,
+        SUM(CASE WHEN amount > 0 THEN 1 ELSE 0 END) AS daily_credit_count
+    FROM {{ ref('stg_transactions') }}
+    WHERE transaction_date >= (SELECT MIN(snapshot_date) FROM snapshot_dates)
+      AND transaction_date < (SELECT MAX(snapshot_date) + 1 FROM snapshot_dates)
+    GROUP BY account_id, transaction_date::DATE
+),
+
+daily_snapshots AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['a.account_id']) }} AS account_key,
-        {{ dbt_utils.generate_surrogate_key(['CURRENT_DATE']) }} AS snapshot_date_key,
+        {{ integer_surrogate_key(['a.account_id']) }} AS account_key,
+        {{ integer_surrogate_key(['d.snapshot_date'], kind='date') }} AS snapshot_date_key,
         a.customer_id,
-        {{ dbt_utils.generate_surrogate_key(['a.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['a.product_id']) }} AS product_key,
-        
+        {{ integer_surrogate_key(['a.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['a.product_id']) }} AS product_key,
+
         -- Snapshot Date
-        CURRENT_DATE AS snapshot_date,
-        
+        d.snapshot_date,
+
         -- Balance Measures
         a.current_balance,
         a.available_balance,
         a.credit_limit,
         a.credit_utilization_pct,
-        
+
         -- Status Measures
         a.account_age_months,
         CASE WHEN a.is_active THEN 1 ELSE 0 END AS active_account_count,
@@ -31,32 +68,23 @@ WITH daily_snapshots AS (
         CASE WHEN a.is_dormant THEN 1 ELSE 0 END AS dormant_account_count,
         CASE WHEN a.is_past_due THEN 1 ELSE 0 END AS past_due_count,
         CASE WHEN a.is_near_limit THEN 1 ELSE 0 END AS near_limit_count,
-        
+
         -- Transaction Activity (from transactions)
         COALESCE(t.daily_transaction_count, 0) AS daily_transaction_count,
         COALESCE(t.daily_transaction_amount, 0) AS daily_transaction_amount,
         COALESCE(t.daily_debit_count, 0) AS daily_debit_count,
         COALESCE(t.daily_credit_count, 0) AS daily_credit_count,
-        
+
         1 AS account_count,
         CURRENT_TIMESTAMP AS dbt_updated_at
-        
-    FROM {{ ref('stg_accounts') }} a
-    LEFT JOIN (
-        SELECT
-            account_id,
-            COUNT(*) AS daily_transaction_count,
-            SUM(amount) AS daily_transaction_amount,
-            SUM(CASE WHEN amount < 0 THEN 1 ELSE 0 END) AS daily_debit_count,
-            SUM(CASE WHEN amount > 0 THEN 1 ELSE 0 END) AS daily_credit_count
-        FROM {{ ref('stg_transactions') }}
-        WHERE transaction_date::DATE = CURRENT_DATE
-        GROUP BY account_id
-    ) t ON a.account_id = t.account_id
-    
-    {% if is_incremental() %}
-    WHERE CURRENT_DATE > (SELECT MAX(snapshot_date) FROM {{ this }})
-    {% endif %}
+
+    -- Account x date spine, from the day each account was opened
+    FROM snapshot_dates d
+    JOIN {{ ref('stg_accounts') }} a
+      ON a.open_date < d.snapshot_date + 1
+    LEFT JOIN daily_activity t
+      ON t.account_id = a.account_id
+     AND t.activity_date = d.snapshot_date
 )
 
-SELECT * FROM daily_snapshots
\ No newline at end of file
+SELECT * FROM daily_snapshots
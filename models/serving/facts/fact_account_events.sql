@@ -8,11 +8,11 @@
 
 WITH account_event_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['ae.event_id']) }} AS event_key,
-        {{ dbt_utils.generate_surrogate_key(['ae.account_id']) }} AS account_key,
-        {{ dbt_utils.generate_surrogate_key(['ae.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['ae.product_id']) }} AS product_key,
-        {{ dbt_utils.generate_surrogate_key(['ae.event_date::date']) }} AS event_date_key,
+        {{ integer_surrogate_key(['ae.event_id']) }} AS event_key,
+        {{ integer_surrogate_key(['ae.account_id']) }} AS account_key,
+        {{ integer_surrogate_key(['ae.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['ae.product_id']) }} AS product_key,
+        {{ integer_surrogate_key(['ae.event_date'], kind='date') }} AS event_date_key,
         
         ae.event_id,
         ae.event_date,
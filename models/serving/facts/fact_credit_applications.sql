@@ -8,11 +8,11 @@
 
 WITH application_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['ca.application_id']) }} AS application_key,
-        {{ dbt_utils.generate_surrogate_key(['ca.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['ca.product_id']) }} AS product_key,
-        {{ dbt_utils.generate_surrogate_key(['ca.application_date::date']) }} AS application_date_key,
-        {{ dbt_utils.generate_surrogate_key(['ca.decision_date::date']) }} AS decision_date_key,
+        {{ integer_surrogate_key(['ca.application_id']) }} AS application_key,
+        {{ integer_surrogate_key(['ca.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['ca.product_id']) }} AS product_key,
+        {{ integer_surrogate_key(['ca.application_date'], kind='date') }} AS application_date_key,
+        {{ integer_surrogate_key(['ca.decision_date'], kind='date') }} AS decision_date_key,
         
         ca.application_id,
         ca.application_date,
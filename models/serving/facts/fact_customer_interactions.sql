@@ -1,16 +1,20 @@
 {{
     config(
-        materialized='table',
+        materialized='partitioned_incremental',
         schema="gold",
+        partition_by='interaction_date',
+        partition_strategy='reload',
         tags=['gold', 'fact', 'serving', 'customer_interactions']
     )
 }}
 
+-- Reloaded from all of silver on every run, like the table it was, so
+-- regenerated bronze and updates to older rows always reach gold
 WITH interaction_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['ci.interaction_id']) }} AS interaction_key,
-        {{ dbt_utils.generate_surrogate_key(['ci.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['ci.interaction_date::date']) }} AS interaction_date_key,
+        {{ integer_surrogate_key(['ci.interaction_id']) }} AS interaction_key,
+        {{ integer_surrogate_key(['ci.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['ci.interaction_date'], kind='date') }} AS interaction_date_key,
         
         ci.interaction_id,
         ci.interaction_date,
@@ -42,7 +42,7 @@ monthly_accounts AS (
 
 monthly_summary AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['t.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['t.customer_id']) }} AS customer_key,
         t.year_month,
         
         -- Transaction Metrics
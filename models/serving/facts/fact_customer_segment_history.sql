@@ -8,10 +8,10 @@
 
 WITH segment_history_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['csh.segment_history_id']) }} AS segment_history_key,
-        {{ dbt_utils.generate_surrogate_key(['csh.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['csh.effective_date::date']) }} AS effective_date_key,
-        {{ dbt_utils.generate_surrogate_key(['csh.end_date::date']) }} AS end_date_key,
+        {{ integer_surrogate_key(['csh.segment_history_id']) }} AS segment_history_key,
+        {{ integer_surrogate_key(['csh.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['csh.effective_date'], kind='date') }} AS effective_date_key,
+        {{ integer_surrogate_key(['csh.end_date'], kind='date') }} AS end_date_key,
         
         csh.segment_history_id,
         csh.effective_date,
@@ -8,12 +8,12 @@
 
 WITH fraud_alert_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['fa.alert_id']) }} AS alert_key,
-        {{ dbt_utils.generate_surrogate_key(['fa.transaction_id']) }} AS transaction_key,
-        {{ dbt_utils.generate_surrogate_key(['fa.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['fa.account_id']) }} AS account_key,
-        {{ dbt_utils.generate_surrogate_key(['fa.alert_date::date']) }} AS alert_date_key,
-        {{ dbt_utils.generate_surrogate_key(['fa.resolution_date::date']) }} AS resolution_date_key,
+        {{ integer_surrogate_key(['fa.alert_id']) }} AS alert_key,
+        {{ integer_surrogate_key(['fa.transaction_id']) }} AS transaction_key,
+        {{ integer_surrogate_key(['fa.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['fa.account_id']) }} AS account_key,
+        {{ integer_surrogate_key(['fa.alert_date'], kind='date') }} AS alert_date_key,
+        {{ integer_surrogate_key(['fa.resolution_date'], kind='date') }} AS resolution_date_key,
         
         fa.alert_id,
         fa.alert_date,
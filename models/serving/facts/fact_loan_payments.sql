@@ -1,18 +1,22 @@
 {{
     config(
-        materialized='table',
+        materialized='partitioned_incremental',
         schema="gold",
+        partition_by='scheduled_date',
+        partition_strategy='reload',
         tags=['gold', 'fact', 'serving', 'loan_payments']
     )
 }}
 
+-- Reloaded from all of silver on every run, like the table it was, so
+-- regenerated bronze and updates to older rows always reach gold
 WITH payment_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['lp.payment_id']) }} AS payment_key,
-        {{ dbt_utils.generate_surrogate_key(['lp.account_id']) }} AS account_key,
-        {{ dbt_utils.generate_surrogate_key(['lp.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['lp.scheduled_date::date']) }} AS scheduled_date_key,
-        {{ dbt_utils.generate_surrogate_key(['lp.actual_date::date']) }} AS actual_date_key,
+        {{ integer_surrogate_key(['lp.payment_id']) }} AS payment_key,
+        {{ integer_surrogate_key(['lp.account_id']) }} AS account_key,
+        {{ integer_surrogate_key(['lp.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['lp.scheduled_date'], kind='date') }} AS scheduled_date_key,
+        {{ integer_surrogate_key(['lp.actual_date'], kind='date') }} AS actual_date_key,
         
         lp.payment_id,
         lp.scheduled_date,
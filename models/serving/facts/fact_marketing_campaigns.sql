@@ -8,9 +8,9 @@
 
 WITH campaign_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['mc.campaign_id']) }} AS campaign_key,
-        {{ dbt_utils.generate_surrogate_key(['mc.start_date::date']) }} AS start_date_key,
-        {{ dbt_utils.generate_surrogate_key(['mc.end_date::date']) }} AS end_date_key,
+        {{ integer_surrogate_key(['mc.campaign_id']) }} AS campaign_key,
+        {{ integer_surrogate_key(['mc.start_date'], kind='date') }} AS start_date_key,
+        {{ integer_surrogate_key(['mc.end_date'], kind='date') }} AS end_date_key,
         
         mc.campaign_id,
         mc.campaign_name,
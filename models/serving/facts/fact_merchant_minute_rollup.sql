@@ -0,0 +1,30 @@
+{{
+    config(
+        materialized='incremental',
+        schema="gold",
+        incremental_strategy='delete+insert',
+        unique_key='minute_bucket',
+        tags=['gold', 'fact', 'serving', 'merchants', 'realtime']
+    )
+}}
+
+-- Pre-aggregated transactions per minute x merchant. The distinct customer keys
+-- are kept so unique-customer counts over any window stay exact. Each run
+-- recomputes the latest stored minute and everything after it; minute_bucket is
+-- the replacement key, not a unique key: delete+insert drops every row of the
+-- recomputed minutes before inserting them.
+SELECT
+    DATE_TRUNC('minute', transaction_date) AS minute_bucket,
+    merchant_key,
+
+    COUNT(*) AS transaction_count,
+    SUM(transaction_amount_abs) AS amount_sum,
+    ARRAY_AGG(DISTINCT customer_key) AS customer_keys,
+
+    CURRENT_TIMESTAMP AS dbt_updated_at
+
+FROM {{ ref('fact_transactions') }}
+{% if is_incremental() %}
+WHERE transaction_date >= (SELECT MAX(minute_bucket) FROM {{ this }})
+{% endif %}
+GROUP BY 1, 2
@@ -9,12 +9,12 @@
 
 WITH regulatory_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['rr.report_id']) }} AS report_key,
-        {{ dbt_utils.generate_surrogate_key(['rr.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['rr.account_id']) }} AS account_key,
-        {{ dbt_utils.generate_surrogate_key(['rr.transaction_id']) }} AS transaction_key,
-        {{ dbt_utils.generate_surrogate_key(['rr.filing_date::date']) }} AS filing_date_key,
-        {{ dbt_utils.generate_surrogate_key(['rr.due_date::date']) }} AS due_date_key,
+        {{ integer_surrogate_key(['rr.report_id']) }} AS report_key,
+        {{ integer_surrogate_key(['rr.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['rr.account_id']) }} AS account_key,
+        {{ integer_surrogate_key(['rr.transaction_id']) }} AS transaction_key,
+        {{ integer_surrogate_key(['rr.filing_date'], kind='date') }} AS filing_date_key,
+        {{ integer_surrogate_key(['rr.due_date'], kind='date') }} AS due_date_key,
         
         rr.report_id,
         rr.report_type_code,
@@ -8,10 +8,10 @@
 
 WITH risk_assessment_facts AS (
     SELECT
-        {{ dbt_utils.generate_surrogate_key(['ra.assessment_id']) }} AS assessment_key,
-        {{ dbt_utils.generate_surrogate_key(['ra.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['ra.assessment_date::date']) }} AS assessment_date_key,
-        {{ dbt_utils.generate_surrogate_key(['ra.next_review_date::date']) }} AS next_review_date_key,
+        {{ integer_surrogate_key(['ra.assessment_id']) }} AS assessment_key,
+        {{ integer_surrogate_key(['ra.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['ra.assessment_date'], kind='date') }} AS assessment_date_key,
+        {{ integer_surrogate_key(['ra.next_review_date'], kind='date') }} AS next_review_date_key,
         
         ra.assessment_id,
         ra.assessment_date,
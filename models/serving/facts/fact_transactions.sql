@@ -1,8 +1,9 @@
 {{
     config(
-        materialized='incremental',
+        materialized='partitioned_incremental',
         schema="gold",
         unique_key='transaction_key',
+        partition_by='transaction_date',
         tags=['gold', 'fact', 'serving', 'transactions']
     )
 }}
@@ -12,11 +13,11 @@ WITH transaction_facts AS (
         t.transaction_id,
         
         -- Surrogate Keys (Dimension References)
-        {{ dbt_utils.generate_surrogate_key(['t.transaction_id']) }} AS transaction_key,
-        {{ dbt_utils.generate_surrogate_key(['t.customer_id']) }} AS customer_key,
-        {{ dbt_utils.generate_surrogate_key(['t.account_id']) }} AS account_key,
-        {{ dbt_utils.generate_surrogate_key(['t.merchant_id']) }} AS merchant_key,
-        {{ dbt_utils.generate_surrogate_key(['t.transaction_date::date']) }} AS date_key,
+        {{ integer_surrogate_key(['t.transaction_id']) }} AS transaction_key,
+        {{ integer_surrogate_key(['t.customer_id']) }} AS customer_key,
+        {{ integer_surrogate_key(['t.account_id']) }} AS account_key,
+        {{ integer_surrogate_key(['t.merchant_id']) }} AS merchant_key,
+        {{ integer_surrogate_key(['t.transaction_date'], kind='date') }} AS date_key,
         
         -- Degenerate Dimensions (Transaction Attributes)
         t.transaction_date,
@@ -0,0 +1,41 @@
+{{
+    config(
+        materialized='incremental',
+        schema="gold",
+        incremental_strategy='delete+insert',
+        unique_key='minute_bucket',
+        tags=['gold', 'fact', 'serving', 'transactions', 'realtime']
+    )
+}}
+
+-- Pre-aggregated transactions per minute x channel x merchant category x status.
+-- Each run recomputes the latest stored minute (it may have been partial) and
+-- everything after it. minute_bucket is the replacement key, not a unique key:
+-- delete+insert drops every row of the recomputed minutes before inserting them.
+SELECT
+    DATE_TRUNC('minute', transaction_date) AS minute_bucket,
+    channel,
+    merchant_category,
+    transaction_status,
+
+    -- Volume
+    COUNT(*) AS transaction_count,
+    SUM(transaction_amount_abs) AS amount_sum,
+
+    -- Risk
+    COUNT(*) FILTER (WHERE is_fraud_flag) AS fraud_count,
+    SUM(is_declined_flag) AS declined_count,
+    COUNT(*) FILTER (WHERE fraud_score >= {{ var('fraud_threshold') }}) AS high_risk_count,
+
+    -- Processing latency
+    COUNT(processing_time_ms) AS processing_time_count,
+    SUM(processing_time_ms) AS processing_time_sum,
+    {{ latency_histogram('processing_time_ms') }},
+
+    CURRENT_TIMESTAMP AS dbt_updated_at
+
+FROM {{ ref('fact_transactions') }}
+{% if is_incremental() %}
+WHERE transaction_date >= (SELECT MAX(minute_bucket) FROM {{ this }})
+{% endif %}
+GROUP BY 1, 2, 3, 4
@@ -0,0 +1,402 @@
+-- Bronze tables loaded by scripts/generate.py (save_to_db); columns follow
+-- models/ingestion/sources.yml. created_at is filled in on load.
+
+CREATE TABLE IF NOT EXISTS bronze.products (
+    product_id BIGINT,
+    product_name TEXT,
+    category TEXT,
+    interest_rate DOUBLE PRECISION,
+    min_balance BIGINT,
+    monthly_fee BIGINT,
+    overdraft_limit BIGINT,
+    product_tier TEXT,
+    is_premium BOOLEAN,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.merchants (
+    merchant_id BIGINT,
+    merchant_name TEXT,
+    category TEXT,
+    mcc_code BIGINT,
+    city TEXT,
+    state TEXT,
+    country TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    risk_rating TEXT,
+    avg_transaction_amount DOUBLE PRECISION,
+    is_online BOOLEAN,
+    established_date TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.customers (
+    customer_id BIGINT,
+    first_name TEXT,
+    last_name TEXT,
+    email TEXT,
+    phone TEXT,
+    date_of_birth TEXT,
+    age BIGINT,
+    ssn TEXT,
+    address TEXT,
+    city TEXT,
+    state TEXT,
+    zip_code BIGINT,
+    country TEXT,
+    signup_date TIMESTAMP,
+    credit_score BIGINT,
+    annual_income BIGINT,
+    employment_status TEXT,
+    employer TEXT,
+    job_title TEXT,
+    education_level TEXT,
+    marital_status TEXT,
+    number_of_dependents BIGINT,
+    home_ownership TEXT,
+    customer_segment TEXT,
+    life_stage TEXT,
+    risk_segment TEXT,
+    is_active BOOLEAN,
+    preferred_channel TEXT,
+    marketing_opt_in BOOLEAN,
+    loyalty_tier TEXT,
+    customer_lifetime_value BIGINT,
+    churn_risk_score DOUBLE PRECISION,
+    last_login_date TEXT,
+    acquisition_channel TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.accounts (
+    account_id BIGINT,
+    customer_id BIGINT,
+    product_id BIGINT,
+    account_number TEXT,
+    account_status TEXT,
+    open_date TIMESTAMP,
+    close_date TIMESTAMP,
+    current_balance DOUBLE PRECISION,
+    available_balance DOUBLE PRECISION,
+    credit_limit DOUBLE PRECISION,
+    currency TEXT,
+    interest_rate DOUBLE PRECISION,
+    minimum_payment DOUBLE PRECISION,
+    payment_due_date TIMESTAMP,
+    last_statement_date TIMESTAMP,
+    autopay_enabled BOOLEAN,
+    overdraft_protection BOOLEAN,
+    primary_account BOOLEAN,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.transactions (
+    transaction_id BIGINT,
+    account_id BIGINT,
+    customer_id BIGINT,
+    merchant_id BIGINT,
+    transaction_date TIMESTAMP,
+    transaction_type TEXT,
+    amount DOUBLE PRECISION,
+    currency TEXT,
+    channel TEXT,
+    merchant_category TEXT,
+    mcc_code BIGINT,
+    description TEXT,
+    is_fraud BOOLEAN,
+    fraud_score DOUBLE PRECISION,
+    location_city TEXT,
+    location_state TEXT,
+    location_country TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    device_id TEXT,
+    ip_address TEXT,
+    is_international BOOLEAN,
+    authorization_code TEXT,
+    card_last_four DOUBLE PRECISION,
+    is_recurring BOOLEAN,
+    hour_of_day BIGINT,
+    day_of_week BIGINT,
+    is_weekend BOOLEAN,
+    distance_from_home_km DOUBLE PRECISION,
+    merchant_risk_score DOUBLE PRECISION,
+    velocity_24h BIGINT,
+    amount_deviation_score DOUBLE PRECISION,
+    processing_time_ms BIGINT,
+    decline_reason TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.credit_applications (
+    application_id BIGINT,
+    customer_id BIGINT,
+    product_id BIGINT,
+    application_date TEXT,
+    requested_amount BIGINT,
+    requested_term_months TEXT,
+    credit_score_at_application BIGINT,
+    annual_income BIGINT,
+    debt_to_income_ratio DOUBLE PRECISION,
+    employment_length_years BIGINT,
+    decision TEXT,
+    decision_date TIMESTAMP,
+    approved_amount DOUBLE PRECISION,
+    approved_rate DOUBLE PRECISION,
+    application_channel TEXT,
+    approval_probability_score DOUBLE PRECISION,
+    risk_grade TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.fraud_alerts (
+    alert_id BIGINT,
+    transaction_id BIGINT,
+    customer_id BIGINT,
+    account_id BIGINT,
+    alert_date TIMESTAMP,
+    alert_type TEXT,
+    alert_severity TEXT,
+    investigation_status TEXT,
+    resolution_date TIMESTAMP,
+    amount_recovered DOUBLE PRECISION,
+    assigned_to TEXT,
+    notes TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.customer_interactions (
+    interaction_id BIGINT,
+    customer_id BIGINT,
+    interaction_date TIMESTAMP,
+    interaction_type TEXT,
+    reason TEXT,
+    duration_minutes BIGINT,
+    sentiment_score DOUBLE PRECISION,
+    satisfaction_rating DOUBLE PRECISION,
+    resolved BOOLEAN,
+    escalated BOOLEAN,
+    agent_id TEXT,
+    notes TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.economic_indicators (
+    date TIMESTAMP,
+    gdp_growth_rate DOUBLE PRECISION,
+    unemployment_rate DOUBLE PRECISION,
+    inflation_rate DOUBLE PRECISION,
+    federal_funds_rate DOUBLE PRECISION,
+    sp500_index DOUBLE PRECISION,
+    vix_index DOUBLE PRECISION,
+    consumer_confidence_index DOUBLE PRECISION,
+    housing_price_index DOUBLE PRECISION,
+    "10yr_treasury_yield" DOUBLE PRECISION,
+    mortgage_rate_30yr DOUBLE PRECISION,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.marketing_campaigns (
+    campaign_id BIGINT,
+    campaign_name TEXT,
+    campaign_type TEXT,
+    start_date TIMESTAMP,
+    end_date TIMESTAMP,
+    target_segment TEXT,
+    budget DOUBLE PRECISION,
+    impressions BIGINT,
+    clicks BIGINT,
+    conversions BIGINT,
+    cost_per_acquisition DOUBLE PRECISION,
+    roi DOUBLE PRECISION,
+    product_promoted BIGINT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.loan_payments (
+    payment_id BIGINT,
+    account_id BIGINT,
+    customer_id BIGINT,
+    scheduled_date TIMESTAMP,
+    actual_date TIMESTAMP,
+    scheduled_amount DOUBLE PRECISION,
+    actual_amount DOUBLE PRECISION,
+    is_late BOOLEAN,
+    days_late BIGINT,
+    late_fee DOUBLE PRECISION,
+    payment_method TEXT,
+    outstanding_balance DOUBLE PRECISION,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.branch_locations (
+    branch_id BIGINT,
+    branch_name TEXT,
+    branch_code TEXT,
+    branch_type TEXT,
+    address TEXT,
+    city TEXT,
+    state TEXT,
+    zip_code BIGINT,
+    country TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    phone TEXT,
+    open_date TEXT,
+    is_active BOOLEAN,
+    square_footage BIGINT,
+    num_employees BIGINT,
+    avg_daily_customers BIGINT,
+    has_safe_deposit BOOLEAN,
+    has_notary BOOLEAN,
+    has_coin_counter BOOLEAN,
+    wheelchair_accessible BOOLEAN,
+    operating_hours TEXT,
+    manager_name TEXT,
+    region TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.atm_locations (
+    atm_id BIGINT,
+    atm_code TEXT,
+    location_name TEXT,
+    location_type TEXT,
+    address TEXT,
+    city TEXT,
+    state TEXT,
+    zip_code BIGINT,
+    country TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    install_date TEXT,
+    is_operational BOOLEAN,
+    is_deposit_enabled BOOLEAN,
+    is_cash_only BOOLEAN,
+    max_withdrawal_amount TEXT,
+    daily_transaction_limit BIGINT,
+    avg_daily_transactions BIGINT,
+    cash_capacity BIGINT,
+    last_refill_date TEXT,
+    last_maintenance_date TEXT,
+    surcharge_fee TEXT,
+    is_24_hour BOOLEAN,
+    has_camera BOOLEAN,
+    branch_id DOUBLE PRECISION,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.risk_assessments (
+    assessment_id BIGINT,
+    customer_id BIGINT,
+    assessment_date TIMESTAMP,
+    assessment_type TEXT,
+    risk_rating TEXT,
+    risk_score DOUBLE PRECISION,
+    credit_risk TEXT,
+    fraud_risk TEXT,
+    aml_risk TEXT,
+    kyc_status TEXT,
+    kyc_last_updated TIMESTAMP,
+    pep_flag BOOLEAN,
+    sanctions_flag BOOLEAN,
+    adverse_media_flag BOOLEAN,
+    high_value_customer BOOLEAN,
+    transaction_volume_last_90d DOUBLE PRECISION,
+    num_accounts BIGINT,
+    years_as_customer DOUBLE PRECISION,
+    employment_verified BOOLEAN,
+    income_verified BOOLEAN,
+    address_verified BOOLEAN,
+    regulatory_concerns TEXT,
+    next_review_date TIMESTAMP,
+    assessor_id TEXT,
+    assessment_notes TEXT,
+    requires_enhanced_due_diligence BOOLEAN,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bronze.account_events (
+    event_id BIGINT,
+    account_id BIGINT,
+    customer_id BIGINT,
+    product_id BIGINT,
+    event_date TIMESTAMP,
+    event_type TEXT,
+    event_category TEXT,
+    old_value DOUBLE PRECISION,
+    new_value DOUBLE PRECISION,
+    triggered_by TEXT,
+    channel TEXT,
+    processed_by TEXT,
+    notes TEXT,
+    is_reversible BOOLEAN,
+    requires_approval BOOLEAN,
+    approval_status TEXT
+);
+
+CREATE TABLE IF NOT EXISTS bronze.regulatory_reports (
+    report_id BIGINT,
+    report_type_code TEXT,
+    report_type_name TEXT,
+    report_period_start TIMESTAMP,
+    report_period_end TIMESTAMP,
+    filing_date TIMESTAMP,
+    due_date TIMESTAMP,
+    actual_filing_date TIMESTAMP,
+    filing_status TEXT,
+    report_frequency TEXT,
+    regulator TEXT,
+    customer_id DOUBLE PRECISION,
+    account_id DOUBLE PRECISION,
+    transaction_id DOUBLE PRECISION,
+    amount_reported DOUBLE PRECISION,
+    risk_level TEXT,
+    requires_follow_up BOOLEAN,
+    follow_up_date TIMESTAMP,
+    assigned_to TEXT,
+    reviewed_by TEXT,
+    approval_date TIMESTAMP,
+    filing_method TEXT,
+    confirmation_number TEXT,
+    findings TEXT,
+    internal_notes TEXT,
+    is_amended BOOLEAN,
+    original_report_id DOUBLE PRECISION,
+    penalty_amount DOUBLE PRECISION
+);
+
+CREATE TABLE IF NOT EXISTS bronze.customer_segments_history (
+    segment_history_id BIGINT,
+    customer_id BIGINT,
+    effective_date TIMESTAMP,
+    end_date TIMESTAMP,
+    is_current BOOLEAN,
+    customer_segment TEXT,
+    previous_segment TEXT,
+    loyalty_tier TEXT,
+    previous_tier TEXT,
+    risk_segment TEXT,
+    previous_risk TEXT,
+    change_type TEXT,
+    change_reason TEXT,
+    triggered_by TEXT,
+    total_accounts BIGINT,
+    total_balance DOUBLE PRECISION,
+    avg_monthly_transactions BIGINT,
+    products_held BIGINT,
+    customer_lifetime_value DOUBLE PRECISION,
+    tenure_days BIGINT,
+    credit_score BIGINT,
+    annual_income DOUBLE PRECISION,
+    last_interaction_days BIGINT,
+    digital_engagement_score DOUBLE PRECISION,
+    branch_visits_last_90d BIGINT,
+    online_logins_last_90d BIGINT,
+    eligible_for_premium BOOLEAN,
+    churn_risk TEXT,
+    cross_sell_opportunity BOOLEAN,
+    notes TEXT,
+    updated_by TEXT
+);
@@ -0,0 +1,122 @@
+from generate import FinancialDataGenerator, Instrumentation, SCALE_FACTORS, DATABASE_URL
+from sqlalchemy import create_engine
+
+import json
+import os
+import sys
+import tempfile
+
+# Fixed window, so derived row counts do not drift with the calendar
+BENCHMARK_START_DATE = '2010-01-01'
+BENCHMARK_END_DATE = '2025-01-01'
+
+
+def run_benchmark(scale_factor, seed=42, skip=(), engine=None):
+    """Time every generate_all stage and the savers at one scale factor
+
+    Returns stage -> instrumentation record; the savers are summed over their
+    tables under save_to_csv / save_to_parquet / save_to_db.
+    """
+    generator = FinancialDataGenerator(BENCHMARK_START_DATE, seed=seed, end_date=BENCHMARK_END_DATE,
+                                       scale_factor=scale_factor)
+    generator.instrumentation = Instrumentation(deep_memory=False)
+
+    # The shipped path: seeding, compaction and stage instrumentation as in generate_all
+    datasets = generator.generate_all(SCALE_FACTORS[scale_factor]['transactions'], skip=skip)
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator.save_to_csv(datasets, output_dir)
+        generator.save_to_parquet(datasets, os.path.join(output_dir, 'parquet'))
+    if engine is not None:
+        generator.save_to_db(datasets, engine)
+
+    results = {}
+    for record in generator.instrumentation.records:
+        key = record['name'] if record['category'] == 'generate' else record['category']
+        if key in results:
+            total = results[key]
+            total['rows'] += record['rows']
+            total['wall_seconds'] += record['wall_seconds']
+            total['cpu_seconds'] += record['cpu_seconds']
+            # None for concurrent stages (save_to_db), whose RSS is process-wide
+            total['peak_rss_mb'] = max((value for value in (total['peak_rss_mb'], record['peak_rss_mb'])
+                                        if value is not None), default=None)
+            total['rows_per_sec'] = round(total['rows'] / total['wall_seconds'], 1) \
+                if total['wall_seconds'] > 0 else None
+        else:
+            results[key] = {field: record[field] for field in (
+                'rows', 'wall_seconds', 'cpu_seconds', 'rows_per_sec', 'peak_rss_mb',
+                'rss_delta_mb', 'frame_mb')}
+    return results
+
+
+def find_regressions(results, baseline, threshold=0.2, min_seconds=0.05):
+    """(scale factor, stage, baseline rows/sec, rows/sec) slower than baseline by more than threshold
+
+    Stages that finished within min_seconds in the baseline are too noisy to
+    compare and are skipped.
+    """
+    regressions = []
+    for scale_factor, stages in results.items():
+        for name, current in stages.items():
+            reference = baseline.get(scale_factor, {}).get(name)
+            if not reference or not reference.get('rows_per_sec') or not current['rows_per_sec']:
+                continue
+            if reference['wall_seconds'] < min_seconds:
+                continue
+            if current['rows_per_sec'] < reference['rows_per_sec'] * (1 - threshold):
+                regressions.append((scale_factor, name, reference['rows_per_sec'],
+                                    current['rows_per_sec']))
+    return regressions
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark every generation stage and saver at fixed scale factors')
+    parser.add_argument('--scale-factors', nargs='+', choices=list(SCALE_FACTORS),
+                        default=['SF0.01', 'SF1'])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip', nargs='*', default=[],
+                        help='stages to leave out (e.g. economic_indicators when offline)')
+    parser.add_argument('--db', action='store_true', help='also time save_to_db against DATABASE_URL')
+    parser.add_argument('--baseline', default='benchmarks/baseline.json')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='store these results as the new baseline instead of comparing')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='fail when a stage is this much slower (rows/sec) than the baseline')
+    parser.add_argument('--output', default=None, help='write the results here as JSON')
+    args = parser.parse_args()
+
+    engine = create_engine(DATABASE_URL) if args.db else None
+
+    print("=" * 60)
+    print("GENERATOR BENCHMARK")
+    print("=" * 60)
+
+    results = {}
+    for scale_factor in args.scale_factors:
+        results[scale_factor] = run_benchmark(scale_factor, args.seed, args.skip, engine)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n   ✓ Baseline written to {args.baseline}")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.threshold)
+
+    print("\n" + "=" * 60)
+    if regressions:
+        for scale_factor, name, reference, current in regressions:
+            print(f"   ✗ {scale_factor} {name}: {current:,.0f} rows/s vs {reference:,.0f} baseline "
+                  f"({current / reference - 1:+.0%})")
+        sys.exit(1)
+    print(f"   ✓ No stage slower than the baseline by more than {args.threshold:.0%}")